@@ -0,0 +1,115 @@
+"""
+Event ID identity vectors (ADR-0002).
+
+The fixture vectors under tests/fixtures/event_id/v1/ are the conformance artifact: any identity
+basis encoder, generic or shape-specialized, MUST reproduce their published event_id values. These
+tests check the vectors themselves; they do not exercise an implementation's encoder.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+FIXTURE_DIR = Path(__file__).resolve().parents[1] / "fixtures" / "event_id" / "v1"
+
+EVENT_ID_PREFIX = "pa:eid:v1:"
+
+# Known identity basis shapes per ADR-0002 ("Specialized identity basis encoders").
+# Leaf members map to True (required) or False (optional); nested dicts are JSON objects.
+KNOWN_SHAPES = {
+    "windows_tier1": {
+        "origin": {
+            "channel": True,
+            "event_id": True,
+            "event_qualifiers": False,
+            "event_version": False,
+            "host": True,
+            "provider_guid": False,
+            "provider_name": True,
+            "record_id": True,
+        },
+        "source_type": True,
+    },
+    "auditd_tier1": {
+        "origin": {"audit_msg_id": True, "audit_node": False, "host": True},
+        "source_type": True,
+    },
+    "journald_tier1": {
+        "origin": {"host": True, "journald_cursor": True},
+        "source_type": True,
+    },
+    "stream_cursor_tier2": {
+        "origin": {"host": True},
+        "source_type": True,
+        "stream": {"cursor": True, "name": True},
+    },
+    "fingerprint_tier3": {
+        "event": {"time_bucket": True},
+        "origin": {"host": True},
+        "payload": {"fingerprint": True},
+        "source_type": True,
+        "stream": {"name": True},
+    },
+}
+
+
+def canonical_json_bytes_jcs_subset(obj: object) -> bytes:
+    """
+    Test-only canonical JSON for JCS-safe subset (strings/ints/bools/null/objects/arrays).
+    This is sufficient for the identity vectors, which use ASCII member names and no floats.
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def event_id_from_canonical_bytes(data: bytes) -> str:
+    return EVENT_ID_PREFIX + hashlib.sha256(data).digest()[:16].hex()
+
+
+def matches_shape(shape: dict, obj: object) -> bool:
+    if not isinstance(obj, dict) or not obj.keys() <= shape.keys():
+        return False
+    for name, spec in shape.items():
+        if name not in obj:
+            if spec is True or isinstance(spec, dict):
+                return False
+        elif isinstance(spec, dict):
+            if not matches_shape(spec, obj[name]):
+                return False
+        elif not isinstance(obj[name], str):
+            return False
+    return True
+
+
+def load_vectors() -> list[dict]:
+    vectors = []
+    for path in sorted(FIXTURE_DIR.glob("*_identity_*.jsonl")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                vectors.append(json.loads(line))
+    return vectors
+
+
+VECTORS = load_vectors()
+
+
+@pytest.mark.parametrize("vector", VECTORS, ids=[v["case"] for v in VECTORS])
+def test_event_id_vector_matches_published_value(vector):
+    canonical = canonical_json_bytes_jcs_subset(vector["identity_basis"])
+    assert event_id_from_canonical_bytes(canonical) == vector["event_id"]
+
+
+@pytest.mark.parametrize("vector", VECTORS, ids=[v["case"] for v in VECTORS])
+def test_event_id_vector_uses_a_known_shape(vector):
+    basis = vector["identity_basis"]
+    assert any(matches_shape(shape, basis) for shape in KNOWN_SHAPES.values())
+
+
+def test_collision_vectors_share_event_id():
+    path = FIXTURE_DIR / "linux_identity_collision.jsonl"
+    lines = [json.loads(x) for x in path.read_text(encoding="utf-8").splitlines() if x.strip()]
+    assert len(lines) >= 2
+    assert len({v["event_id"] for v in lines}) == 1